@@ -10,11 +10,15 @@ import json
 from pathlib import Path
 from core import MenuPlanner
 
+# Section separator
+BAR = "=" * 60
+
+
 def add_recipe_interactive():
     """Interactive recipe entry via command line."""
-    print("="*60)
+    print(BAR)
     print("MANUAL RECIPE ENTRY")
-    print("="*60)
+    print(BAR)
     print("For sites like Coles that block automated scraping\n")
 
     # Get recipe name
@@ -85,9 +89,9 @@ def add_recipe_interactive():
     }
 
     # Show summary
-    print("\n" + "="*60)
+    print(f"\n{BAR}")
     print("RECIPE SUMMARY")
-    print("="*60)
+    print(BAR)
     print(f"Name: {recipe['name']}")
     print(f"Servings: {recipe['servings']}")
     print(f"Cooking time: {recipe['cooking_time']}")
@@ -5,17 +5,18 @@ This module handles all user interaction for the command-line interface.
 It uses the core.MenuPlanner class for business logic.
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-from core import MenuPlanner
-from services.web_scraper import (
-    fetch_recipe_from_url,
-    normalize_recipe,
-    RecipeScraperError,
-    RecipeNotFoundError
-)
+from core import MenuPlanner, dump_json
+
+# Maximum number of recipe URLs fetched concurrently during import
+MAX_IMPORT_WORKERS = 8
+
+# Section separators
+BAR = "=" * 60
+DASH = "-" * 60
 
 
 def get_user_input() -> Dict[str, Any]:
@@ -68,27 +69,28 @@ def display_menu(menu: List[Dict[str, Any]]) -> None:
     Args:
         menu: List of scaled recipes
     """
-    print("\n" + "="*60)
-    print("YOUR WEEKLY MENU")
-    print("="*60)
+    # Build the whole menu and write it in one go rather than one print per line
+    lines = ["", BAR, "YOUR WEEKLY MENU", BAR]
 
     for i, recipe in enumerate(menu, 1):
-        print(f"\n{'='*60}")
-        print(f"NIGHT {i}: {recipe['name'].upper()}")
-        print(f"{'='*60}")
-        print(f"Cooking time: {recipe['cooking_time']} | Servings: {recipe['scaled_servings']}")
+        lines.append(f"\n{BAR}")
+        lines.append(f"NIGHT {i}: {recipe['name'].upper()}")
+        lines.append(BAR)
+        lines.append(f"Cooking time: {recipe['cooking_time']} | Servings: {recipe['scaled_servings']}")
 
-        print(f"\nIngredients:")
+        lines.append("\nIngredients:")
         for ingredient in recipe["ingredients"]:
             amount = ingredient["amount"]
             unit = ingredient["unit"]
             name = ingredient["name"]
-            print(f"  • {name}: {amount} {unit}")
+            lines.append(f"  • {name}: {amount} {unit}")
 
         if "steps" in recipe:
-            print(f"\nCooking Steps:")
+            lines.append("\nCooking Steps:")
             for step_num, step in enumerate(recipe["steps"], 1):
-                print(f"  {step_num}. {step}")
+                lines.append(f"  {step_num}. {step}")
+
+    print("\n".join(lines))
 
 
 def display_shopping_list(shopping_list: Dict[str, Dict[str, float]]) -> None:
@@ -98,15 +100,14 @@ def display_shopping_list(shopping_list: Dict[str, Dict[str, float]]) -> None:
     Args:
         shopping_list: Dictionary mapping ingredient names to {amount, unit}
     """
-    print("\n" + "="*60)
-    print("SHOPPING LIST")
-    print("="*60)
+    lines = ["", BAR, "SHOPPING LIST", BAR]
 
-    sorted_items = sorted(shopping_list.items())
-    for name, details in sorted_items:
-        amount = details["amount"]
-        unit = details["unit"]
-        print(f"  • {name}: {amount} {unit}")
+    # Sort names only (no (key, value) tuples); one dict lookup per item
+    for name in sorted(shopping_list):
+        details = shopping_list[name]
+        lines.append(f"  • {name}: {details['amount']} {details['unit']}")
+
+    print("\n".join(lines))
 
 
 def display_warnings(warnings: List[str]) -> None:
@@ -137,8 +138,7 @@ def save_plan(plan: Dict[str, Any], output_path: str = "last_plan.json") -> None
     }
 
     plan_path = Path(__file__).parent / output_path
-    with open(plan_path, "w") as f:
-        json.dump(save_data, f, indent=2)
+    dump_json(save_data, plan_path)
 
     print(f"\n✓ Plan saved to {plan_path}")
 
@@ -150,12 +150,12 @@ def prompt_for_recipe_urls() -> List[str]:
     Returns:
         List of URLs entered by user (empty list if none)
     """
-    print("\n" + "="*60)
+    print(f"\n{BAR}")
     print("IMPORT RECIPES FROM URLS")
-    print("="*60)
+    print(BAR)
     print("Enter recipe URLs (one per line).")
     print("Press Enter on an empty line when done.")
-    print("-"*60)
+    print(DASH)
 
     urls = []
     while True:
@@ -171,6 +171,8 @@ def prompt_for_recipe_urls() -> List[str]:
 def import_recipes_from_urls(planner: MenuPlanner, urls: List[str]) -> List[Dict[str, Any]]:
     """
     Import recipes from URLs and add them to the planner as temporary recipes.
+    URLs are fetched concurrently; results are processed in input order so
+    recipe IDs are assigned in the same order the URLs were entered.
 
     Args:
         planner: MenuPlanner instance
@@ -179,18 +181,32 @@ def import_recipes_from_urls(planner: MenuPlanner, urls: List[str]) -> List[Dict
     Returns:
         List of successfully imported recipes
     """
+    # Imported lazily: the scraping stack is slow to import and only
+    # needed when the user actually imports URLs
+    from services.web_scraper import (
+        fetch_recipe_from_url,
+        normalize_recipe,
+        RecipeScraperError,
+        RecipeNotFoundError
+    )
+
     imported_recipes = []
 
-    print("\n" + "="*60)
+    print(f"\n{BAR}")
     print("IMPORTING RECIPES...")
-    print("="*60)
+    print(BAR)
+
+    # Start all fetches up front; each one is a blocking network round-trip
+    executor = ThreadPoolExecutor(max_workers=max(1, min(MAX_IMPORT_WORKERS, len(urls))))
+    futures = [executor.submit(fetch_recipe_from_url, url) for url in urls]
+    executor.shutdown(wait=False)  # Workers exit once the submitted fetches finish
 
-    for i, url in enumerate(urls, 1):
+    for i, (url, future) in enumerate(zip(urls, futures), 1):
         print(f"\n[{i}/{len(urls)}] Fetching: {url}")
 
         try:
-            # Fetch recipe from URL
-            raw_recipe = fetch_recipe_from_url(url)
+            # Wait for this URL's fetch to finish
+            raw_recipe = future.result()
 
             # Normalize to our format
             recipe_id = planner.get_next_recipe_id()
@@ -227,9 +243,9 @@ def display_imported_recipes(recipes: List[Dict[str, Any]]) -> None:
         print("\nNo recipes were imported.")
         return
 
-    print("\n" + "="*60)
+    print(f"\n{BAR}")
     print(f"SUCCESSFULLY IMPORTED {len(recipes)} RECIPE(S)")
-    print("="*60)
+    print(BAR)
 
     for recipe in recipes:
         print(f"\n• {recipe['name']}")
@@ -249,9 +265,9 @@ def prompt_to_save_recipes(planner: MenuPlanner) -> bool:
     if not planner.temp_recipes:
         return False
 
-    print("\n" + "="*60)
+    print(f"\n{BAR}")
     print("SAVE IMPORTED RECIPES?")
-    print("="*60)
+    print(BAR)
     print(f"\nYou have {len(planner.temp_recipes)} imported recipe(s).")
     print("Would you like to save them permanently to recipes.json?")
 
@@ -280,7 +296,7 @@ def run_cli():
         planner = MenuPlanner("recipes.json")
 
         # Ask if user wants to import recipes from URLs
-        print("\n" + "="*60)
+        print(f"\n{BAR}")
         while True:
             import_choice = input("Import recipes from URLs? (y/n): ").lower().strip()
             if import_choice in ['y', 'yes', 'n', 'no']:
@@ -321,7 +337,7 @@ def run_cli():
             prompt_to_save_recipes(planner)
 
         # Success message
-        print("\n" + "="*60)
+        print(f"\n{BAR}")
         print("Happy cooking! 🍳")
 
     except FileNotFoundError as e:
@@ -5,10 +5,123 @@ This module contains pure business logic for meal planning with no I/O operation
 All functions return data structures that can be used by any interface (CLI, Web, GUI).
 """
 
+import gzip
 import json
+import os
+import pickle
 import random
+import sys
+import threading
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; large files are then loaded in one go
+    ijson = None
+
+# JSON arrays larger than this are stream-parsed with ijson when available
+STREAM_PARSE_MIN_BYTES = 8 * 1024 * 1024
+
+
+def _loads(data: bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Encode an object as a single compact JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+def load_json(path: Path) -> Any:
+    """Load JSON from a file, using orjson when it is installed."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def dump_json(data: Any, path: Path) -> None:
+    """Write data to a file as indented JSON in a single write, using orjson when it is installed."""
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        # json.dump() writes piece by piece; encode up front instead
+        encoded = json.dumps(data, indent=2).encode("utf-8")
+    Path(path).write_bytes(encoded)
+
+
+def iter_json_array(path: Path) -> Iterator[Any]:
+    """
+    Iterate over the items of a JSON array file.
+
+    Large files are stream-parsed with ijson (when installed) so the raw
+    document never has to be held in memory alongside the parsed items.
+    """
+    if ijson is not None and path.stat().st_size >= STREAM_PARSE_MIN_BYTES:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+        return
+    yield from load_json(path)
+
+
+def iter_jsonl(path: Path) -> Iterator[Any]:
+    """Iterate over the documents of a JSON Lines file, one line at a time."""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
+
+def load_jsonl(path: Path) -> List[Any]:
+    """Load a JSON Lines file (one JSON document per line)."""
+    return list(iter_jsonl(path))
+
+
+def dump_jsonl(records: List[Any], path: Path, append: bool = False) -> None:
+    """Write records to a JSON Lines file, optionally appending to it."""
+    with open(path, "ab" if append else "wb") as f:
+        f.write(b"".join(_dumps_line(record) for record in records))
+
+
+def intern_ingredients(recipes: List[Dict[str, Any]]) -> None:
+    """
+    Intern ingredient names and units in place.
+
+    The same names and units repeat across many recipes; interning
+    makes each distinct string a single shared object, so the shopping-list
+    dict lookups compare by identity and the corpus takes less memory.
+    """
+    for recipe in recipes:
+        for ingredient in recipe["ingredients"]:
+            ingredient["name"] = sys.intern(ingredient["name"])
+            ingredient["unit"] = sys.intern(ingredient["unit"])
+
+
+def migrate_recipes_to_jsonl(json_path: str = "recipes.json",
+                             jsonl_path: str = None) -> Path:
+    """
+    Convert a legacy recipes.json array into JSON Lines format.
+
+    Args:
+        json_path: Path to the existing recipes JSON file
+        jsonl_path: Output path (defaults to json_path with a .jsonl suffix)
+
+    Returns:
+        Path to the written JSON Lines file
+    """
+    json_path = Path(json_path)
+    jsonl_path = Path(jsonl_path) if jsonl_path else json_path.with_suffix(".jsonl")
+    dump_jsonl(load_json(json_path), jsonl_path)
+    return jsonl_path
 
 
 class MenuPlanner:
@@ -19,16 +132,128 @@ class MenuPlanner:
         Initialize the menu planner with recipes.
 
         Args:
-            recipes_path: Path to recipes JSON file
+            recipes_path: Path to recipes JSON file. A ".jsonl" path stores one
+                recipe per line so new recipes are appended instead of
+                rewriting the whole file.
         """
         self.recipes_path = Path(recipes_path)
         self.recipes = self._load_recipes()
+        # Size and mtime of the file self.recipes matches, so writes can tell
+        # when another process (CLI, manual entry tool) has changed it
+        self._file_stamp = self._stat_recipes_file()
         self.temp_recipes = []  # Temporary recipes for current session only
+        # Incremented whenever self.recipes changes, so callers can cache
+        # anything derived from it (e.g. serialized API responses)
+        self.recipes_version = 0
+        # Next ID to hand out; only ever moves forward (see get_next_recipe_id)
+        self._next_id = 1
+        self._id_lock = threading.Lock()
+        # Held while the recipe library or temp list is changed, so concurrent
+        # requests (gunicorn threads) can't interleave writes
+        self._lock = threading.RLock()
+        self._rebuild_index()
 
     def _load_recipes(self) -> List[Dict[str, Any]]:
-        """Load recipes from JSON file."""
-        with open(self.recipes_path, "r") as f:
-            return json.load(f)
+        """Load recipes from JSON file, interning ingredient names and units."""
+        recipes = self._load_recipes_uncached()
+        intern_ingredients(recipes)
+        return recipes
+
+    def _load_recipes_uncached(self) -> List[Dict[str, Any]]:
+        """
+        Load recipes from JSON file (or its pickled sidecar).
+
+        Without orjson, a pickled copy of the recipes (e.g. recipes.json.pkl.gz)
+        is kept next to the JSON file and used whenever it is at least as new,
+        since unpickling is faster than the stdlib json parser. orjson beats
+        the pickle, so the sidecar is skipped when it is installed.
+        """
+        if orjson is not None:
+            return self._read_recipes(self.recipes_path)
+
+        cache_path = self._cache_path()
+        try:
+            if cache_path.stat().st_mtime_ns >= self.recipes_path.stat().st_mtime_ns:
+                with open(cache_path, "rb") as f:
+                    return pickle.loads(gzip.decompress(f.read()))
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass  # Missing or unreadable cache: rebuild from JSON
+
+        recipes = self._read_recipes(self.recipes_path)
+        self._write_cache(recipes)
+        return recipes
+
+    def _stat_recipes_file(self) -> Optional[tuple]:
+        """(mtime_ns, size) of the recipes file, or None if it can't be read."""
+        try:
+            stat = self.recipes_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _reload_if_changed(self) -> None:
+        """
+        Re-read the recipes file if it changed on disk since it was last
+        loaded or written by this planner. Call with self._lock held.
+        """
+        stamp = self._stat_recipes_file()
+        if stamp == self._file_stamp:
+            return
+        self.recipes = self._load_recipes()
+        self._file_stamp = stamp
+        self.recipes_version += 1
+        self._rebuild_index()
+
+    def _cache_path(self) -> Path:
+        """Path of the pickled recipe cache next to the recipes file (one per file)."""
+        return self.recipes_path.with_name(self.recipes_path.name + ".pkl.gz")
+
+    def _write_cache(self, recipes: List[Dict[str, Any]]) -> None:
+        """Refresh the pickled recipe cache (no-op when orjson is installed)."""
+        if orjson is not None:
+            return
+
+        cache_path = self._cache_path()
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(pickle.dumps(recipes, pickle.HIGHEST_PROTOCOL)))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # The cache is only an optimisation (e.g. read-only deploys)
+
+    def _rebuild_index(self) -> None:
+        """
+        Rebuild the per-preference recipe lists used by filter_recipes(),
+        the set of saved recipe names used for duplicate checks, the ID
+        lookups behind get_recipe_by_id()/is_temp_recipe() and the highest
+        recipe ID used by get_next_recipe_id().
+        Must be called, with self._lock held, whenever self.recipes or
+        self.temp_recipes is replaced.
+        """
+        self._all = self.recipes + self.temp_recipes
+        self._by_time = {"quick": [], "long": []}
+        for recipe in self._all:
+            self._by_time.setdefault(recipe["cooking_time"], []).append(recipe)
+        self._recipe_names = {r["name"].lower() for r in self.recipes}
+        # Reversed so the first recipe wins if an ID is ever duplicated
+        self._recipes_by_id = {r["id"]: r for r in reversed(self.recipes)}
+        self._temp_ids = {r["id"] for r in self.temp_recipes}
+        self._max_id = max((r["id"] for r in self._all), default=0)
+
+    def _index_saved_recipe(self, recipe: Dict[str, Any]) -> None:
+        """Add a recipe just appended to self.recipes to the lookup indexes."""
+        self._all.insert(len(self.recipes) - 1, recipe)
+        self._by_time.setdefault(recipe["cooking_time"], []).append(recipe)
+        self._recipe_names.add(recipe["name"].lower())
+        self._recipes_by_id.setdefault(recipe["id"], recipe)
+        self._max_id = max(self._max_id, recipe["id"])
+
+    def _names_in(self, recipes: List[Dict[str, Any]]) -> set:
+        """Lowercase recipe names in a recipe list, reusing the index for self.recipes."""
+        if recipes is self.recipes:
+            return self._recipe_names
+        return {r["name"].lower() for r in recipes}
 
     def filter_recipes(self, preference: str) -> List[Dict[str, Any]]:
         """
@@ -39,14 +264,12 @@ class MenuPlanner:
             preference: "quick", "long", or "mixed"
 
         Returns:
-            Filtered list of recipes
+            Filtered list of recipes. This is the planner's internal index,
+            so callers must copy it before mutating.
         """
-        # Combine permanent and temporary recipes
-        all_recipes = self.recipes + self.temp_recipes
-
         if preference == "mixed":
-            return all_recipes
-        return [r for r in all_recipes if r["cooking_time"] == preference]
+            return self._all
+        return self._by_time.get(preference, [])
 
     def select_recipes(self, nights: int, preference: str) -> tuple[List[Dict[str, Any]], bool]:
         """
@@ -71,29 +294,35 @@ class MenuPlanner:
         remaining_nights = nights - len(selected)
 
         if remaining_nights > 0:
-            # Get permanent recipes only (exclude temp recipes)
-            filtered = self.filter_recipes(preference)
-            # Remove any temp recipes from filtered list
-            filtered = [r for r in filtered if r not in self.temp_recipes]
+            # Get permanent recipes only (exclude temp recipes, already added)
+            temp_ids = {r["id"] for r in self.temp_recipes}
+            pools = [self._exclude_ids(self.filter_recipes(preference), temp_ids)]
 
             # If insufficient recipes, add from other category
-            if len(filtered) < remaining_nights and preference != "mixed":
+            if len(pools[0]) < remaining_nights and preference != "mixed":
                 had_to_mix = True
                 other_pref = "long" if preference == "quick" else "quick"
-                # Get all recipes from combined pool
-                all_recipes = self.recipes + self.temp_recipes
-                other_recipes = [r for r in all_recipes if r["cooking_time"] == other_pref]
-                # Remove temp recipes (already added)
-                other_recipes = [r for r in other_recipes if r not in self.temp_recipes]
-                filtered.extend(other_recipes)
-
-            # Randomly select remaining recipes without replacement
-            if filtered:
-                additional = random.sample(filtered, min(remaining_nights, len(filtered)))
-                selected.extend(additional)
+                pools.append(self._exclude_ids(self.filter_recipes(other_pref), temp_ids))
+
+            # Randomly select remaining recipes without replacement. Indices are
+            # sampled across the pools so they never have to be concatenated.
+            total = sum(len(pool) for pool in pools)
+            for index in random.sample(range(total), min(remaining_nights, total)):
+                for pool in pools:
+                    if index < len(pool):
+                        selected.append(pool[index])
+                        break
+                    index -= len(pool)
 
         return selected, had_to_mix
 
+    @staticmethod
+    def _exclude_ids(recipes: List[Dict[str, Any]], ids: set) -> List[Dict[str, Any]]:
+        """Return recipes whose IDs are not in ids (the list itself if ids is empty)."""
+        if not ids:
+            return recipes
+        return [r for r in recipes if r["id"] not in ids]
+
     def scale_recipe(self, recipe: Dict[str, Any], household_size: int) -> Dict[str, Any]:
         """
         Scale recipe ingredients based on household size.
@@ -103,20 +332,42 @@ class MenuPlanner:
             household_size: Number of people to serve
 
         Returns:
-            Recipe with scaled ingredients
+            Recipe with scaled ingredients. When household_size equals the
+            recipe's servings, the original ingredient list is reused rather
+            than copied, so it must not be mutated.
         """
-        scaled_recipe = recipe.copy()
+        return {
+            **recipe,
+            "ingredients": self._scaled_ingredients(recipe, household_size),
+            "scaled_servings": household_size,
+        }
+
+    @staticmethod
+    def _scaled_ingredients(recipe: Dict[str, Any], household_size: int) -> List[Dict[str, Any]]:
+        """Ingredient list of a recipe scaled to household_size (the original list when unscaled)."""
+        # Nothing to scale: skip the per-ingredient multiply/round/copy
+        if household_size == recipe["servings"]:
+            return recipe["ingredients"]
+
         scale_factor = household_size / recipe["servings"]
+        return [
+            {**ingredient, "amount": round(ingredient["amount"] * scale_factor, 1)}
+            for ingredient in recipe["ingredients"]
+        ]
 
-        scaled_ingredients = []
-        for ingredient in recipe["ingredients"]:
-            scaled_ingredient = ingredient.copy()
-            scaled_ingredient["amount"] = round(ingredient["amount"] * scale_factor, 1)
-            scaled_ingredients.append(scaled_ingredient)
+    @staticmethod
+    def _add_to_totals(ingredients: List[Dict[str, Any]], totals: Dict[str, float],
+                       units: Dict[str, str]) -> None:
+        """Add ingredient amounts to flat name -> total / name -> unit maps."""
+        for ingredient in ingredients:
+            name = ingredient["name"]
 
-        scaled_recipe["ingredients"] = scaled_ingredients
-        scaled_recipe["scaled_servings"] = household_size
-        return scaled_recipe
+            # Simple aggregation - assumes same units
+            if name in totals:
+                totals[name] += ingredient["amount"]
+            else:
+                totals[name] = ingredient["amount"]
+                units[name] = ingredient["unit"]
 
     def aggregate_shopping_list(self, menu: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
         """
@@ -128,25 +379,51 @@ class MenuPlanner:
         Returns:
             Dictionary mapping ingredient names to {amount, unit}
         """
-        shopping_list = {}
+        # Accumulate into flat name -> total / name -> unit maps and only
+        # build the nested {amount, unit} dicts once at the end
+        totals = {}
+        units = {}
 
         for recipe in menu:
-            for ingredient in recipe["ingredients"]:
-                name = ingredient["name"]
-                amount = ingredient["amount"]
-                unit = ingredient["unit"]
+            self._add_to_totals(recipe["ingredients"], totals, units)
 
-                if name not in shopping_list:
-                    shopping_list[name] = {"amount": 0, "unit": unit}
-
-                # Simple aggregation - assumes same units
-                shopping_list[name]["amount"] += amount
+        return self._shopping_list_from_totals(totals, units)
 
+    @staticmethod
+    def _shopping_list_from_totals(totals: Dict[str, float],
+                                   units: Dict[str, str]) -> Dict[str, Dict[str, float]]:
+        """Build the {name: {amount, unit}} shopping list from flat totals."""
         # Round amounts for cleaner display
-        for item in shopping_list.values():
-            item["amount"] = round(item["amount"], 1)
+        return {
+            name: {"amount": round(total, 1), "unit": units[name]}
+            for name, total in totals.items()
+        }
+
+    def _scale_and_aggregate(self, recipes: List[Dict[str, Any]],
+                             household_size: int) -> tuple[List[Dict[str, Any]], Dict[str, Dict[str, float]]]:
+        """
+        Scale recipes and aggregate their ingredients recipe by recipe.
+        Equivalent to scale_recipe() on each recipe followed by
+        aggregate_shopping_list(), and built from the same helpers, so the
+        scaling and aggregation rules live in one place.
+
+        Args:
+            recipes: Selected recipes
+            household_size: Number of people to serve
+
+        Returns:
+            Tuple of (menu of scaled recipes, shopping list)
+        """
+        menu = []
+        totals = {}
+        units = {}
+
+        for recipe in recipes:
+            ingredients = self._scaled_ingredients(recipe, household_size)
+            self._add_to_totals(ingredients, totals, units)
+            menu.append({**recipe, "ingredients": ingredients, "scaled_servings": household_size})
 
-        return shopping_list
+        return menu, self._shopping_list_from_totals(totals, units)
 
     def generate_plan(self, household_size: int, nights: int,
                      preference: str) -> Dict[str, Any]:
@@ -168,14 +445,8 @@ class MenuPlanner:
         # Select recipes
         selected_recipes, had_to_mix = self.select_recipes(nights, preference)
 
-        # Scale recipes for household size
-        menu = [
-            self.scale_recipe(recipe, household_size)
-            for recipe in selected_recipes
-        ]
-
-        # Generate shopping list
-        shopping_list = self.aggregate_shopping_list(menu)
+        # Scale recipes for household size and generate shopping list
+        menu, shopping_list = self._scale_and_aggregate(selected_recipes, household_size)
 
         # Build result
         plan = {
@@ -208,25 +479,82 @@ class MenuPlanner:
         Args:
             recipe: Recipe dictionary (must be validated before calling)
         """
-        self.temp_recipes.append(recipe)
+        intern_ingredients([recipe])
+        with self._lock:
+            self.temp_recipes.append(recipe)
+            self._all.append(recipe)
+            self._by_time.setdefault(recipe["cooking_time"], []).append(recipe)
+            self._temp_ids.add(recipe["id"])
+            self._max_id = max(self._max_id, recipe["id"])
+
+    def add_temp_recipes_bulk(self, recipes: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add several recipes to the temporary recipe list in one step.
+        Recipes whose ID is already temporary (or repeated in the batch) are skipped.
+
+        Args:
+            recipes: Recipe dictionaries (must be validated before calling)
+
+        Returns:
+            Number of recipes added
+        """
+        with self._lock:
+            added = []
+            for recipe in recipes:
+                if recipe["id"] not in self._temp_ids:
+                    self._temp_ids.add(recipe["id"])
+                    added.append(recipe)
+            if not added:
+                return 0
+
+            intern_ingredients(added)
+            self.temp_recipes.extend(added)
+            self._all.extend(added)
+            for recipe in added:
+                self._by_time.setdefault(recipe["cooking_time"], []).append(recipe)
+            self._max_id = max(self._max_id, max(r["id"] for r in added))
+
+        return len(added)
+
+    def get_recipe_by_id(self, recipe_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Look up a saved (permanent) recipe by ID.
+
+        Args:
+            recipe_id: Recipe ID
+
+        Returns:
+            The recipe, or None if no saved recipe has that ID
+        """
+        return self._recipes_by_id.get(recipe_id)
+
+    def is_temp_recipe(self, recipe_id: int) -> bool:
+        """Check whether a recipe with this ID is in the temporary recipe list."""
+        return recipe_id in self._temp_ids
 
     def clear_temp_recipes(self) -> None:
         """Clear all temporary recipes from current session."""
-        self.temp_recipes = []
+        with self._lock:
+            self.temp_recipes = []
+            self._rebuild_index()
 
     def get_next_recipe_id(self) -> int:
         """
-        Generate the next available recipe ID.
+        Reserve the next available recipe ID.
+
+        Each call returns a new ID, even when called concurrently, and IDs
+        are never reused within the session (deleting recipes doesn't lower it).
+        Recipes saved by other processes since the last load are taken into account.
 
         Returns:
             Next sequential ID number
         """
-        all_recipes = self.recipes + self.temp_recipes
-        if not all_recipes:
-            return 1
-
-        max_id = max(recipe["id"] for recipe in all_recipes)
-        return max_id + 1
+        with self._lock:
+            self._reload_if_changed()
+        with self._id_lock:
+            next_id = max(self._next_id, self._max_id + 1)
+            self._next_id = next_id + 1
+            return next_id
 
     def save_recipe_to_file(self, recipe: Dict[str, Any],
                            file_path: str = None) -> None:
@@ -246,39 +574,33 @@ class MenuPlanner:
         # Validate recipe schema
         validate_recipe_schema(recipe)
 
-        # Use default path if none provided
-        if file_path is None:
-            file_path = str(self.recipes_path)
+        with self._lock:
+            path, existing_recipes = self._recipes_for_path(file_path)
 
-        # Load current recipes
-        path = Path(file_path)
-        if path.exists():
-            with open(path, "r") as f:
-                existing_recipes = json.load(f)
-        else:
-            existing_recipes = []
-
-        # Check for duplicate by name (case-insensitive)
-        recipe_name_lower = recipe["name"].lower()
-        for existing in existing_recipes:
-            if existing["name"].lower() == recipe_name_lower:
+            # Check for duplicate by name (case-insensitive)
+            if recipe["name"].lower() in self._names_in(existing_recipes):
                 raise ValueError(
-                    f"Recipe '{recipe['name']}' already exists in {file_path}"
+                    f"Recipe '{recipe['name']}' already exists in {path}"
                 )
 
-        # Append recipe
-        existing_recipes.append(recipe)
-
-        # Save back to file with pretty formatting
-        with open(path, "w") as f:
-            json.dump(existing_recipes, f, indent=2)
-
-        # Reload recipes to include the new one
-        self.recipes = self._load_recipes()
+            # Append recipe (updates self.recipes in place for the default
+            # path), taking it out again if it can't be written
+            existing_recipes.append(recipe)
+            try:
+                self._persist_new_recipes(path, existing_recipes, [recipe])
+            except BaseException:
+                existing_recipes.pop()
+                raise
+            if existing_recipes is self.recipes:
+                self._file_stamp = self._stat_recipes_file()
+                self._write_cache(self.recipes)
+                self._index_saved_recipe(recipe)
+                self.recipes_version += 1
 
     def save_temp_recipes_to_file(self, file_path: str = None) -> int:
         """
         Save all temporary recipes permanently to the recipes JSON file.
+        Duplicates are skipped and the file is written once for the whole batch.
 
         Args:
             file_path: Path to recipes file (defaults to self.recipes_path)
@@ -289,30 +611,118 @@ class MenuPlanner:
         Raises:
             ValueError: If any recipe fails validation or is a duplicate
         """
-        if not self.temp_recipes:
-            return 0
+        from services.web_scraper import validate_recipe_schema
 
-        saved_count = 0
-        for recipe in self.temp_recipes:
-            try:
-                self.save_recipe_to_file(recipe, file_path)
-                saved_count += 1
-            except ValueError:
-                # Skip duplicates but continue with others
-                pass
+        with self._lock:
+            if not self.temp_recipes:
+                return 0
+
+            path, existing_recipes = self._recipes_for_path(file_path)
+            existing_names = self._names_in(existing_recipes)
+
+            to_save = []
+            batch_names = set()
+            for recipe in self.temp_recipes:
+                validate_recipe_schema(recipe)
+
+                # Skip duplicates (against the file and this batch) but continue with others
+                name_lower = recipe["name"].lower()
+                if name_lower in existing_names or name_lower in batch_names:
+                    continue
+                batch_names.add(name_lower)
+                to_save.append(recipe)
+
+            if to_save:
+                existing_recipes.extend(to_save)
+                try:
+                    self._persist_new_recipes(path, existing_recipes, to_save)
+                except BaseException:
+                    del existing_recipes[-len(to_save):]
+                    raise
+                if existing_recipes is self.recipes:
+                    self._file_stamp = self._stat_recipes_file()
+                    self._write_cache(self.recipes)
+                    self.recipes_version += 1
+
+            # Clear temp recipes after saving
+            self.clear_temp_recipes()
+
+        return len(to_save)
+
+    def _recipes_for_path(self, file_path: str = None) -> tuple[Path, List[Dict[str, Any]]]:
+        """
+        Resolve a recipes file path and the recipe list it holds.
+        The planner's own file is served from memory instead of being re-read,
+        unless another process has changed it since. Call with self._lock held.
+
+        Args:
+            file_path: Path to recipes file (defaults to self.recipes_path)
+
+        Returns:
+            Tuple of (resolved path, mutable list of recipes for that path)
+        """
+        path = Path(file_path) if file_path is not None else self.recipes_path
+        if path == self.recipes_path:
+            self._reload_if_changed()
+            return path, self.recipes
+
+        if path.exists():
+            return path, self._read_recipes(path)
+        return path, []
+
+    @staticmethod
+    def _iter_recipes(path: Path) -> Iterator[Dict[str, Any]]:
+        """Yield recipes one at a time from a JSON array or JSON Lines file."""
+        if path.suffix == ".jsonl":
+            return iter_jsonl(path)
+        return iter_json_array(path)
+
+    @classmethod
+    def _read_recipes(cls, path: Path) -> List[Dict[str, Any]]:
+        """Read recipes from a JSON array or JSON Lines file."""
+        return list(cls._iter_recipes(path))
+
+    @staticmethod
+    def _write_recipes(path: Path, recipes: List[Dict[str, Any]]) -> None:
+        """
+        Write the full recipe list to disk with pretty formatting.
+        The list is written to a temp file and renamed over the original,
+        so the file is never left half-written.
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        if path.suffix == ".jsonl":
+            dump_jsonl(recipes, tmp_path)
+        else:
+            dump_json(recipes, tmp_path)
+        os.replace(tmp_path, path)
 
-        # Clear temp recipes after saving
-        self.clear_temp_recipes()
+    @classmethod
+    def _persist_new_recipes(cls, path: Path, recipes: List[Dict[str, Any]],
+                             new_recipes: List[Dict[str, Any]]) -> None:
+        """
+        Persist newly added recipes.
 
-        return saved_count
+        JSON Lines files only need the new recipes appended; a JSON array
+        has to be rewritten in full.
 
-    def delete_recipes_by_ids(self, recipe_ids: List[int],
+        Args:
+            path: Recipes file path
+            recipes: Full recipe list, already including new_recipes
+            new_recipes: Recipes added since the last write
+        """
+        if path.suffix == ".jsonl":
+            dump_jsonl(new_recipes, path, append=True)
+        else:
+            cls._write_recipes(path, recipes)
+
+    def delete_recipes_by_ids(self, recipe_ids: Iterable[int],
                              file_path: str = None) -> int:
         """
         Delete recipes by their IDs from the permanent recipe file.
+        The planner's own file is filtered in memory and rewritten once.
 
         Args:
-            recipe_ids: List of recipe IDs to delete
+            recipe_ids: IDs of the recipes to delete (any iterable; a set is built once)
             file_path: Path to recipes file (defaults to self.recipes_path)
 
         Returns:
@@ -321,34 +731,35 @@ class MenuPlanner:
         Raises:
             ValueError: If file doesn't exist or can't be written
         """
+        recipe_ids = frozenset(recipe_ids)
         if not recipe_ids:
             return 0
 
-        # Use default path if none provided
-        if file_path is None:
-            file_path = str(self.recipes_path)
-
-        # Load current recipes
-        path = Path(file_path)
+        path = Path(file_path) if file_path is not None else self.recipes_path
         if not path.exists():
-            raise ValueError(f"Recipe file {file_path} does not exist")
-
-        with open(path, "r") as f:
-            existing_recipes = json.load(f)
-
-        # Filter out recipes with matching IDs
-        initial_count = len(existing_recipes)
-        filtered_recipes = [
-            recipe for recipe in existing_recipes
-            if recipe["id"] not in recipe_ids
-        ]
-        deleted_count = initial_count - len(filtered_recipes)
-
-        # Save updated recipes back to file
-        with open(path, "w") as f:
-            json.dump(filtered_recipes, f, indent=2)
-
-        # Reload recipes to sync in-memory list
-        self.recipes = self._load_recipes()
+            raise ValueError(f"Recipe file {path} does not exist")
+
+        with self._lock:
+            path, existing_recipes = self._recipes_for_path(file_path)
+
+            # Filter out recipes with matching IDs in one pass
+            filtered_recipes = [
+                recipe for recipe in existing_recipes
+                if recipe["id"] not in recipe_ids
+            ]
+            deleted_count = len(existing_recipes) - len(filtered_recipes)
+            if not deleted_count:
+                return 0
+
+            # Save updated recipes back to file
+            self._write_recipes(path, filtered_recipes)
+
+            # Keep the in-memory list in sync when it was our own file
+            if existing_recipes is self.recipes:
+                self.recipes = filtered_recipes
+                self._file_stamp = self._stat_recipes_file()
+                self.recipes_version += 1
+                self._write_cache(self.recipes)
+                self._rebuild_index()
 
         return deleted_count
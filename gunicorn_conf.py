@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration for the Menu Planner web app.
+
+Run with: gunicorn -c gunicorn_conf.py web:app
+"""
+
+import os
+
+# Bind to the platform-provided port (Render, Railway, etc.)
+bind = f"0.0.0.0:{os.environ.get('PORT', '5001')}"
+
+# Exactly one worker process: temporary recipes, chat sessions and caches
+# live in the process's memory, so a second worker would not see them, and
+# workers would race on recipes.json and last_plan.tmp. WEB_CONCURRENCY is
+# deliberately ignored, since hosting platforms often set it. Concurrency
+# comes from threads instead, which suits the I/O-bound scraping and AI calls;
+# MenuPlanner serialises its own writes.
+workers = 1
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Recipe scraping waits up to 30s and AI calls can be slow
+timeout = 120
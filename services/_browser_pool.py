@@ -0,0 +1,141 @@
+"""
+Headless Chrome Pool
+
+Keeps a few warm Selenium WebDriver instances for sites that need a real
+browser (Coles), so each fetch doesn't pay Chrome startup.
+Pool size is read from the COLES_POOL_SIZE environment variable (default 2).
+"""
+
+from contextlib import contextmanager
+import atexit
+import os
+import queue
+import threading
+
+
+POOL_SIZE = max(1, int(os.environ.get('COLES_POOL_SIZE', 2)))
+
+_idle = queue.Queue()
+_slots = threading.BoundedSemaphore(POOL_SIZE)
+_lock = threading.Lock()
+_drivers = []  # every live driver, so they can be quit at exit
+_driver_path = None
+
+# Requests Chrome should never make: images, fonts, media and trackers
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
+
+
+def _get_driver_path() -> str:
+    """Resolve the chromedriver binary once per process."""
+    global _driver_path
+    with _lock:
+        if _driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+def _create_driver():
+    """Start a new headless Chrome instance."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+
+    # Setup headless Chrome
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    # Only JSON-LD and page text are read, so skip images and GPU work, and
+    # return from get() immediately; callers wait for what they need
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.page_load_strategy = 'none'
+
+    service = Service(_get_driver_path())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+
+    with _lock:
+        _drivers.append(driver)
+
+    # Block at the network layer too, so no sockets are opened for them
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except BaseException:
+        _discard(driver)  # don't leave a half-set-up Chrome running until exit
+        raise
+
+    return driver
+
+
+def _discard(driver) -> None:
+    """Quit a driver and forget it."""
+    with _lock:
+        if driver in _drivers:
+            _drivers.remove(driver)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+@contextmanager
+def borrow_driver():
+    """
+    Borrow a WebDriver from the pool, starting one if none is idle.
+
+    Blocks while POOL_SIZE drivers are already in use. Drivers are reset to
+    about:blank when returned. A driver that raises a WebDriverException is
+    assumed broken and replaced on next use.
+
+    Yields:
+        Selenium Chrome WebDriver
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    _slots.acquire()
+    try:
+        try:
+            driver = _idle.get_nowait()
+        except queue.Empty:
+            driver = _create_driver()
+    except BaseException:
+        _slots.release()
+        raise
+
+    broken = False
+    try:
+        yield driver
+    except WebDriverException:
+        broken = True
+        raise
+    finally:
+        if not broken:
+            # Leave the previous site behind so the next borrower can never
+            # read its page while their own navigation is still pending
+            try:
+                driver.get("about:blank")
+            except WebDriverException:
+                broken = True
+        if broken:
+            _discard(driver)
+        else:
+            _idle.put(driver)
+        _slots.release()
+
+
+@atexit.register
+def shutdown() -> None:
+    """Quit every driver the pool has started."""
+    with _lock:
+        drivers = list(_drivers)
+    for driver in drivers:
+        _discard(driver)
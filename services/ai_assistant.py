@@ -5,11 +5,38 @@ Uses Google Gemini API (free tier) to help users find BBC Good Food recipes
 through natural conversation.
 """
 
+import hashlib
+import json
 import os
 import re
-from typing import List, Dict, Any, Tuple
-import google.generativeai as genai
+import threading
+from typing import List, Dict, Any, Iterator, Tuple
 
+from services.cache import TTLCache
+
+
+# Pattern to match BBC Good Food recipe URLs
+_BBC_URL_RE = re.compile(r'https?://(?:www\.)?bbcgoodfood\.com/recipes/[a-z0-9-]+', re.IGNORECASE)
+
+# Use models/gemini-2.5-flash - the free tier model
+MODEL_NAME = 'models/gemini-2.5-flash'
+
+# genai.configure() sets process-wide SDK state, so it runs once (per API key)
+# and every AIAssistant shares the resulting model
+_configure_lock = threading.Lock()
+_configured_key = None
+_MODEL = None
+
+# Only the most recent turns (user + model message pairs) are sent to Gemini,
+# which keeps the per-request cost bounded in long conversations
+MAX_HISTORY_TURNS = 6
+
+# Word runs used to normalise prompts for the response cache
+_WORD_RE = re.compile(r"\w+")
+
+# Gemini replies keyed by a hash of the full conversation, so replayed or
+# repeated conversations are answered without another API round trip
+_RESPONSE_CACHE = TTLCache(maxsize=512, ttl=3600)
 
 # System prompt to guide the AI
 SYSTEM_PROMPT = """You are a helpful meal planning assistant that specializes in recommending recipes from BBC Good Food (bbcgoodfood.com).
@@ -55,6 +82,41 @@ Would you like to add any of these to your meal plan?"
 Remember: Only recommend recipes you're confident are current and active on BBC Good Food. Avoid niche, seasonal, or very specific recipe names that may have been archived."""
 
 
+def _normalize_prompt(text: str) -> str:
+    """Lowercase text and drop punctuation/extra whitespace so trivially different prompts match."""
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+
+def _response_cache_key(user_message: str, conversation_history: List[Dict[str, str]]) -> bytes:
+    """Hash everything the model sees for a turn into a response cache key."""
+    turns = [(msg["role"], _normalize_prompt(msg["content"])) for msg in conversation_history]
+    payload = json.dumps([SYSTEM_PROMPT, turns, _normalize_prompt(user_message)])
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+
+def _content_text(content) -> str:
+    """Text of a chat history entry (an SDK Content object or a plain dict)."""
+    parts = content["parts"] if isinstance(content, dict) else content.parts
+    return "".join(part if isinstance(part, str) else part.text for part in parts)
+
+
+def _shared_model(api_key: str):
+    """Configure the Gemini SDK if needed and return the process-wide model."""
+    global _configured_key, _MODEL
+
+    with _configure_lock:
+        if _MODEL is None or _configured_key != api_key:
+            # Imported here so the SDK (~1s to import) is only loaded when the
+            # assistant is actually configured
+            import google.generativeai as genai
+
+            genai.configure(api_key=api_key)
+            _MODEL = genai.GenerativeModel(MODEL_NAME)
+            _configured_key = api_key
+
+        return _MODEL
+
+
 class AIAssistant:
     """AI-powered recipe recommendation assistant using Google Gemini."""
 
@@ -73,47 +135,142 @@ class AIAssistant:
                 "Get your free API key from https://aistudio.google.com/app/apikey"
             )
 
-        # Configure Gemini
-        genai.configure(api_key=self.api_key)
-        # Use models/gemini-2.5-flash - the free tier model
-        self.model = genai.GenerativeModel('models/gemini-2.5-flash')
+        # Configure Gemini (once per process)
+        self.model = _shared_model(self.api_key)
+
+        # Fixed opening turns for every chat. Keeping this prefix identical
+        # across requests lets Gemini's implicit prefix caching apply.
+        self._base_history = [
+            {"role": "user", "parts": [SYSTEM_PROMPT]},
+            {"role": "model", "parts": ["Understood."]},
+        ]
+
+        # Live chat sessions keyed by conversation ID, so follow-up turns
+        # reuse the session instead of rebuilding it from the history
+        self._sessions = TTLCache(maxsize=256, ttl=1800)
 
-    def chat(self, user_message: str, conversation_history: List[Dict[str, str]] = None) -> Tuple[str, List[str]]:
+    def chat(self, user_message: str, conversation_history: List[Dict[str, str]] = None,
+             conversation_id: str = None) -> Tuple[str, List[str]]:
         """
         Send a message to the AI and get a response with recipe URLs.
+        Only the last MAX_HISTORY_TURNS turns of the history are sent to the model.
 
         Args:
             user_message: The user's message
             conversation_history: List of previous messages [{"role": "user"/"assistant", "content": "..."}]
+            conversation_id: Optional client conversation ID; when given, the chat
+                session is kept between calls and reused while it matches the history
 
         Returns:
             Tuple of (AI response text, List of extracted BBC Good Food URLs)
         """
-        conversation_history = conversation_history or []
+        conversation_history = (conversation_history or [])[-2 * MAX_HISTORY_TURNS:]
 
-        # Build conversation for Gemini
-        messages = [{"role": "user", "parts": [SYSTEM_PROMPT]}]
+        cache_key = _response_cache_key(user_message, conversation_history)
+        ai_response = _RESPONSE_CACHE.get(cache_key)
+        if ai_response is not None:
+            self._forget_session(conversation_id)
+            return ai_response, self.extract_bbc_recipe_urls(ai_response)
 
-        # Add conversation history
-        for msg in conversation_history:
-            role = "user" if msg["role"] == "user" else "model"
-            messages.append({"role": role, "parts": [msg["content"]]})
-
-        # Add current user message
-        messages.append({"role": "user", "parts": [user_message]})
-
-        # Start chat
-        chat = self.model.start_chat(history=messages[:-1])
+        chat = self._start_chat(conversation_history, conversation_id)
 
         # Get response
         response = chat.send_message(user_message)
         ai_response = response.text
+        self._finish_chat(chat, cache_key, conversation_id, ai_response)
 
         # Extract BBC Good Food URLs
         recipe_urls = self.extract_bbc_recipe_urls(ai_response)
 
         return ai_response, recipe_urls
 
+    def chat_stream(self, user_message: str, conversation_history: List[Dict[str, str]] = None,
+                    conversation_id: str = None) -> Iterator[str]:
+        """
+        Send a message to the AI and yield the response text as it is generated.
+        Takes the same arguments as chat(); recipe URLs can be extracted from
+        the joined chunks with extract_bbc_recipe_urls once the stream ends.
+
+        Args:
+            user_message: The user's message
+            conversation_history: List of previous messages [{"role": "user"/"assistant", "content": "..."}]
+            conversation_id: Optional client conversation ID (see chat())
+
+        Yields:
+            Successive pieces of the AI response text
+        """
+        conversation_history = (conversation_history or [])[-2 * MAX_HISTORY_TURNS:]
+
+        cache_key = _response_cache_key(user_message, conversation_history)
+        ai_response = _RESPONSE_CACHE.get(cache_key)
+        if ai_response is not None:
+            self._forget_session(conversation_id)
+            yield ai_response
+            return
+
+        chat = self._start_chat(conversation_history, conversation_id)
+
+        chunks = []
+        for chunk in chat.send_message(user_message, stream=True):
+            chunks.append(chunk.text)
+            yield chunk.text
+
+        self._finish_chat(chat, cache_key, conversation_id, "".join(chunks))
+
+    def forget_response(self, user_message: str, conversation_history: List[Dict[str, str]] = None) -> None:
+        """
+        Drop a cached reply so the same turn is answered by the model again
+        (e.g. when every recipe link it suggested turned out to be dead).
+
+        Args:
+            user_message: The user's message, as passed to chat()
+            conversation_history: The history, as passed to chat()
+        """
+        conversation_history = (conversation_history or [])[-2 * MAX_HISTORY_TURNS:]
+        _RESPONSE_CACHE.pop(_response_cache_key(user_message, conversation_history), None)
+
+    def _start_chat(self, conversation_history: List[Dict[str, str]], conversation_id: str = None):
+        """Get the stored chat session for a conversation, or start one from the history."""
+        # Take the session out while in use so concurrent requests for the
+        # same conversation never share one
+        chat = self._sessions.pop(conversation_id) if conversation_id else None
+
+        # Session history is the base history plus every turn so far; rebuild
+        # if it has drifted from what the client sent (cleared chat, or a
+        # reply the client never saw or saw replaced)
+        if chat is None or not self._session_matches(chat, conversation_history):
+            # Build conversation for Gemini; the current user message is sent
+            # separately, so it is not part of the history
+            history = self._base_history + [
+                {"role": "user" if msg["role"] == "user" else "model", "parts": [msg["content"]]}
+                for msg in conversation_history
+            ]
+
+            # Start chat
+            chat = self.model.start_chat(history=history)
+
+        return chat
+
+    def _session_matches(self, chat, conversation_history: List[Dict[str, str]]) -> bool:
+        """Check a stored session has the client's turn count and last message."""
+        if len(chat.history) != len(self._base_history) + len(conversation_history):
+            return False
+        if not conversation_history:
+            return True
+        return _content_text(chat.history[-1]) == conversation_history[-1]["content"]
+
+    def _forget_session(self, conversation_id: str = None) -> None:
+        """Drop a conversation's stored session (its history no longer matches the client's)."""
+        if conversation_id:
+            self._sessions.pop(conversation_id, None)
+
+    def _finish_chat(self, chat, cache_key: bytes, conversation_id: str, ai_response: str) -> None:
+        """Cache a completed reply and keep the session for the conversation's next turn."""
+        _RESPONSE_CACHE.set(cache_key, ai_response)
+
+        if conversation_id:
+            self._sessions.set(conversation_id, chat)
+
     @staticmethod
     def extract_bbc_recipe_urls(text: str) -> List[str]:
         """
@@ -125,22 +282,15 @@ class AIAssistant:
         Returns:
             List of unique BBC Good Food recipe URLs
         """
-        # Pattern to match BBC Good Food recipe URLs
-        pattern = r'https?://(?:www\.)?bbcgoodfood\.com/recipes/[a-z0-9-]+'
-
-        urls = re.findall(pattern, text, re.IGNORECASE)
+        urls = _BBC_URL_RE.findall(text)
 
-        # Return unique URLs, preserving order
-        seen = set()
-        unique_urls = []
+        # Return unique URLs (compared lowercase without www), keeping the
+        # first spelling of each in order
+        unique = {}
         for url in urls:
-            # Normalize URL (lowercase, remove www)
-            normalized = url.lower().replace('www.', '')
-            if normalized not in seen:
-                seen.add(normalized)
-                unique_urls.append(url)
+            unique.setdefault(url.lower().replace('www.', ''), url)
 
-        return unique_urls
+        return list(unique.values())
 
 
 # Error classes
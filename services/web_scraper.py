@@ -7,12 +7,43 @@ For protected sites like Coles, uses Selenium with headless browser.
 """
 
 from typing import Dict, Any, Optional, List
-from recipe_scrapers import scrape_me
+from contextlib import closing
+from datetime import timedelta
+from pathlib import Path
 import json
 import re
+import sqlite3
+import time
 from urllib.parse import urlparse
 
 
+# On-disk cache of fetched recipes, keyed by URL
+RECIPE_CACHE_PATH = Path(__file__).resolve().parent.parent / ".recipe_cache.sqlite"
+RECIPE_CACHE_TTL = timedelta(days=7)
+
+# Parsing patterns, compiled once at import
+_ISO_DUR_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?')
+_NUMBERED_STEP_RE = re.compile(r'\d+[\.\)]\s*')
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_DIGITS_RE = re.compile(r'\d+')
+_JSON_LD_TAG_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Browser-like headers for the plain HTTP attempt at Coles pages
+_COLES_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-AU,en;q=0.9",
+}
+# Markers of a bot challenge page served with a 200 status
+_CHALLENGE_MARKERS = ('cf-chl', '_Incapsula_Resource')
+
+
 class RecipeScraperError(Exception):
     """Base exception for recipe scraping errors."""
     pass
@@ -34,9 +65,98 @@ def is_coles_url(url: str) -> bool:
     return 'coles.com.au' in parsed.netloc and ('recipe' in url.lower() or 'inspiration' in url.lower())
 
 
+# Browser-side scripts for fetch_coles_recipe, so each page needs one
+# WebDriver round trip per extraction instead of one per element
+_JSON_LD_SCRIPT = (
+    "return Array.from(document.querySelectorAll('script[type=\"application/ld+json\"]'),"
+    " s => s.innerHTML);"
+)
+_HTML_FALLBACK_SCRIPT = """
+const texts = sel => Array.from(document.querySelectorAll(sel), e => e.innerText).filter(t => t.trim());
+const h1 = document.querySelector('h1');
+return {
+    title: h1 ? h1.innerText : '',
+    ingredients: texts('[data-testid="ingredient"], .ingredient, [class*="ingredient"]'),
+    instructions: texts('[data-testid="instruction"], .instruction, [class*="method"] li, [class*="instruction"]')
+};
+"""
+
+
+def _find_json_ld_recipe(scripts: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Find the first schema.org Recipe in a list of JSON-LD script bodies.
+
+    Args:
+        scripts: Raw text of each <script type="application/ld+json"> tag
+
+    Returns:
+        The Recipe object, or None if no script contains one
+    """
+    for script in scripts:
+        try:
+            data = json.loads(script)
+        except json.JSONDecodeError:
+            continue
+
+        # Handle both single recipe and list of items
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if isinstance(item, dict) and item.get('@type') == 'Recipe':
+                return item
+
+    return None
+
+
+def _recipe_from_json_ld(recipe_data: Dict[str, Any], url: str) -> Dict[str, Any]:
+    """Convert a schema.org Recipe object from a Coles page to a raw recipe dict."""
+    return {
+        "name": recipe_data.get('name', ''),
+        "ingredients": recipe_data.get('recipeIngredient', []),
+        "instructions": '\n'.join([
+            step.get('text', '') if isinstance(step, dict) else str(step)
+            for step in recipe_data.get('recipeInstructions', [])
+        ]),
+        "total_time": _parse_iso_duration(recipe_data.get('totalTime', '')),
+        "yields": recipe_data.get('recipeYield', '4'),
+        "image": recipe_data.get('image', {}).get('url', '') if isinstance(recipe_data.get('image'), dict) else recipe_data.get('image', ''),
+        "host": "coles.com.au",
+        "url": url
+    }
+
+
+def _fetch_coles_recipe_http(url: str) -> Optional[Dict[str, Any]]:
+    """
+    Try to read a Coles recipe's JSON-LD with a plain HTTP request.
+
+    Args:
+        url: Coles recipe URL
+
+    Returns:
+        Raw recipe dictionary, or None if the request was blocked or
+        challenged, or the page has no Recipe JSON-LD
+    """
+    import requests
+
+    try:
+        response = requests.get(url, headers=_COLES_HEADERS, timeout=10)
+    except requests.RequestException:
+        return None
+
+    html = response.text
+    if response.status_code != 200 or any(marker in html for marker in _CHALLENGE_MARKERS):
+        return None
+
+    recipe_data = _find_json_ld_recipe(_JSON_LD_TAG_RE.findall(html))
+    return _recipe_from_json_ld(recipe_data, url) if recipe_data else None
+
+
 def fetch_coles_recipe(url: str) -> Dict[str, Any]:
     """
-    Fetch recipe from Coles Australia using Selenium to bypass WAF.
+    Fetch recipe from Coles Australia, using Selenium to bypass WAF.
+
+    A plain HTTP request is tried first; the browser is only used when that
+    is blocked or the page has no JSON-LD. Browsers come from a small shared
+    pool (see services/_browser_pool.py).
 
     Args:
         url: Coles recipe URL
@@ -48,88 +168,55 @@ def fetch_coles_recipe(url: str) -> Dict[str, Any]:
         RecipeNotFoundError: If recipe data cannot be extracted
         RecipeScraperError: For browser or parsing errors
     """
+    recipe = _fetch_coles_recipe_http(url)
+    if recipe:
+        return recipe
+
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from selenium.webdriver.chrome.options import Options
         from selenium.webdriver.common.by import By
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
-
-        # Setup headless Chrome
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+        from selenium.common.exceptions import TimeoutException
+        from services._browser_pool import borrow_driver
 
-        # Initialize driver
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        try:
-            # Load page
+        # Reuse a warm browser from the pool
+        with borrow_driver() as driver:
+            # Load page (returns immediately, page_load_strategy is 'none')
+            old_page = driver.find_element(By.TAG_NAME, "html")
             driver.get(url)
 
-            # Wait for page to load (wait for recipe content)
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            # Wait for the new document to replace the previous one (so its
+            # JSON-LD can't be matched), then for the recipe JSON-LD, then
+            # stop loading the rest of the page. Without it, the page keeps
+            # loading for the HTML fallback.
+            try:
+                wait = WebDriverWait(driver, 10)
+                wait.until(EC.staleness_of(old_page))
+                wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'script[type="application/ld+json"]'))
+                )
+                driver.execute_script("window.stop();")
+            except TimeoutException:
+                pass
 
-            # Try to extract JSON-LD data first
+            # Try to extract JSON-LD data first (one round trip for all tags)
             recipe_data = None
             try:
-                scripts = driver.find_elements(By.CSS_SELECTOR, 'script[type="application/ld+json"]')
-                for script in scripts:
-                    try:
-                        data = json.loads(script.get_attribute('innerHTML'))
-                        # Handle both single recipe and list of items
-                        if isinstance(data, list):
-                            for item in data:
-                                if item.get('@type') == 'Recipe':
-                                    recipe_data = item
-                                    break
-                        elif isinstance(data, dict) and data.get('@type') == 'Recipe':
-                            recipe_data = data
-
-                        if recipe_data:
-                            break
-                    except json.JSONDecodeError:
-                        continue
+                recipe_data = _find_json_ld_recipe(driver.execute_script(_JSON_LD_SCRIPT))
             except Exception:
                 pass
 
             # If JSON-LD found, extract data
             if recipe_data:
-                return {
-                    "name": recipe_data.get('name', ''),
-                    "ingredients": recipe_data.get('recipeIngredient', []),
-                    "instructions": '\n'.join([
-                        step.get('text', '') if isinstance(step, dict) else str(step)
-                        for step in recipe_data.get('recipeInstructions', [])
-                    ]),
-                    "total_time": _parse_iso_duration(recipe_data.get('totalTime', '')),
-                    "yields": recipe_data.get('recipeYield', '4'),
-                    "image": recipe_data.get('image', {}).get('url', '') if isinstance(recipe_data.get('image'), dict) else recipe_data.get('image', ''),
-                    "host": "coles.com.au",
-                    "url": url
-                }
-
-            # Fallback: Try HTML parsing
-            try:
-                # Get title
-                title = driver.find_element(By.CSS_SELECTOR, 'h1').text
+                return _recipe_from_json_ld(recipe_data, url)
 
-                # Get ingredients
-                ingredient_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="ingredient"], .ingredient, [class*="ingredient"]')
-                ingredients = [elem.text for elem in ingredient_elements if elem.text.strip()]
-
-                # Get instructions
-                instruction_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="instruction"], .instruction, [class*="method"] li, [class*="instruction"]')
-                instructions = '\n'.join([elem.text for elem in instruction_elements if elem.text.strip()])
+            # Fallback: Try HTML parsing (title, ingredients and instructions
+            # collected in a single script call)
+            try:
+                page = driver.execute_script(_HTML_FALLBACK_SCRIPT)
+                title = page['title']
+                ingredients = page['ingredients']
+                instructions = '\n'.join(page['instructions'])
 
                 if title and (ingredients or instructions):
                     return {
@@ -147,9 +234,6 @@ def fetch_coles_recipe(url: str) -> Dict[str, Any]:
 
             raise RecipeNotFoundError(f"Could not extract recipe data from Coles page: {url}")
 
-        finally:
-            driver.quit()
-
     except ImportError as e:
         raise RecipeScraperError(
             f"Selenium not installed. Run: pip install -r requirements.txt\n"
@@ -164,7 +248,7 @@ def _parse_iso_duration(duration_str: str) -> int:
     if not duration_str:
         return 0
 
-    match = re.search(r'PT(?:(\d+)H)?(?:(\d+)M)?', duration_str)
+    match = _ISO_DUR_RE.search(duration_str)
     if match:
         hours = int(match.group(1) or 0)
         minutes = int(match.group(2) or 0)
@@ -172,13 +256,54 @@ def _parse_iso_duration(duration_str: str) -> int:
     return 0
 
 
-def fetch_recipe_from_url(url: str) -> Dict[str, Any]:
+def _connect_recipe_cache() -> sqlite3.Connection:
+    """Open the recipe cache database, creating the table if needed."""
+    conn = sqlite3.connect(RECIPE_CACHE_PATH, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS recipes ("
+        "url TEXT PRIMARY KEY, fetched_at REAL NOT NULL, data TEXT NOT NULL)"
+    )
+    return conn
+
+
+def _get_cached_recipe(url: str) -> Optional[Dict[str, Any]]:
+    """Return the cached raw recipe for a URL, or None if missing, expired or unreadable."""
+    try:
+        with closing(_connect_recipe_cache()) as conn:
+            row = conn.execute(
+                "SELECT fetched_at, data FROM recipes WHERE url = ?", (url,)
+            ).fetchone()
+
+        if row is None or time.time() - row[0] > RECIPE_CACHE_TTL.total_seconds():
+            return None
+        return json.loads(row[1])
+    except (sqlite3.Error, TypeError, ValueError):
+        return None  # A corrupt row is treated as a miss and refetched
+
+
+def _store_cached_recipe(url: str, recipe: Dict[str, Any]) -> None:
+    """Store a raw recipe in the cache. Failures are ignored (cache is best-effort)."""
+    try:
+        with closing(_connect_recipe_cache()) as conn:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO recipes (url, fetched_at, data) VALUES (?, ?, ?)",
+                    (url, time.time(), json.dumps(recipe))
+                )
+    except (sqlite3.Error, TypeError, ValueError):
+        pass
+
+
+def fetch_recipe_from_url(url: str, force_refresh: bool = False) -> Dict[str, Any]:
     """
     Fetch and parse a recipe from a URL using schema.org Recipe data.
     Routes Coles URLs to custom Selenium-based scraper to bypass WAF.
+    Successful fetches are cached on disk (see RECIPE_CACHE_TTL), so
+    re-importing the same URL skips the network entirely.
 
     Args:
         url: URL of the recipe page
+        force_refresh: Skip the cache lookup and re-fetch (the result is still cached)
 
     Returns:
         Raw recipe dictionary with fields from schema.org
@@ -187,11 +312,23 @@ def fetch_recipe_from_url(url: str) -> Dict[str, Any]:
         RecipeNotFoundError: If no recipe data found at URL
         RecipeScraperError: For network errors or parsing failures
     """
+    recipe_data = None if force_refresh else _get_cached_recipe(url)
+    if recipe_data is None:
+        recipe_data = _fetch_recipe_uncached(url)
+        _store_cached_recipe(url, recipe_data)
+    return recipe_data
+
+
+def _fetch_recipe_uncached(url: str) -> Dict[str, Any]:
+    """Fetch a recipe from the network, bypassing the cache."""
     # Check if this is a Coles URL and use custom scraper
     if is_coles_url(url):
         return fetch_coles_recipe(url)
 
     # Use standard recipe-scrapers library for other sites
+    # (imported here as it takes ~0.5s to import)
+    from recipe_scrapers import scrape_me
+
     try:
         scraper = scrape_me(url)
 
@@ -219,6 +356,25 @@ def fetch_recipe_from_url(url: str) -> Dict[str, Any]:
         raise RecipeScraperError(f"Failed to fetch recipe from {url}: {str(e)}")
 
 
+# Required fields and their types, for validate_recipe_schema
+_RECIPE_FIELD_TYPES = {
+    "name": str,
+    "cooking_time": str,
+    "servings": (int, float),
+    "ingredients": list,
+    "steps": list
+}
+_INGREDIENT_FIELD_TYPES = {"name": str, "amount": (int, float), "unit": str}
+_VALID_COOKING_TIMES = ["quick", "long"]
+
+
+def _type_name(expected_type) -> str:
+    """Readable name for a type or tuple of types (e.g. "int or float")."""
+    if isinstance(expected_type, tuple):
+        return " or ".join(t.__name__ for t in expected_type)
+    return expected_type.__name__
+
+
 def validate_recipe_schema(recipe: Dict[str, Any]) -> None:
     """
     Validate that a recipe has all required fields with correct types.
@@ -229,22 +385,14 @@ def validate_recipe_schema(recipe: Dict[str, Any]) -> None:
     Raises:
         RecipeValidationError: If recipe is missing required fields or has invalid data
     """
-    required_fields = {
-        "name": str,
-        "cooking_time": str,
-        "servings": (int, float),
-        "ingredients": list,
-        "steps": list
-    }
-
     # Check required fields exist
-    for field, expected_type in required_fields.items():
+    for field, expected_type in _RECIPE_FIELD_TYPES.items():
         if field not in recipe:
             raise RecipeValidationError(f"Recipe is missing required field: {field}")
 
         if not isinstance(recipe[field], expected_type):
             raise RecipeValidationError(
-                f"Recipe field '{field}' must be of type {expected_type.__name__}, "
+                f"Recipe field '{field}' must be of type {_type_name(expected_type)}, "
                 f"got {type(recipe[field]).__name__}"
             )
 
@@ -258,8 +406,7 @@ def validate_recipe_schema(recipe: Dict[str, Any]) -> None:
                 f"Ingredient {i+1} must be a dictionary, got {type(ingredient).__name__}"
             )
 
-        required_ing_fields = {"name": str, "amount": (int, float), "unit": str}
-        for field, expected_type in required_ing_fields.items():
+        for field, expected_type in _INGREDIENT_FIELD_TYPES.items():
             if field not in ingredient:
                 raise RecipeValidationError(
                     f"Ingredient {i+1} is missing required field: {field}"
@@ -267,7 +414,7 @@ def validate_recipe_schema(recipe: Dict[str, Any]) -> None:
             if not isinstance(ingredient[field], expected_type):
                 raise RecipeValidationError(
                     f"Ingredient {i+1} field '{field}' must be of type "
-                    f"{expected_type.__name__}"
+                    f"{_type_name(expected_type)}"
                 )
 
     # Validate steps
@@ -281,10 +428,9 @@ def validate_recipe_schema(recipe: Dict[str, Any]) -> None:
             )
 
     # Validate cooking_time
-    valid_cooking_times = ["quick", "long"]
-    if recipe["cooking_time"] not in valid_cooking_times:
+    if recipe["cooking_time"] not in _VALID_COOKING_TIMES:
         raise RecipeValidationError(
-            f"cooking_time must be one of {valid_cooking_times}, "
+            f"cooking_time must be one of {_VALID_COOKING_TIMES}, "
             f"got '{recipe['cooking_time']}'"
         )
 
@@ -325,6 +471,34 @@ IMPERIAL_TO_METRIC = {
 }
 
 
+# Metric and counting units kept as written when parsing ingredients
+_OTHER_UNITS = {
+    "g", "gram", "grams", "kg", "kilogram", "kilograms",
+    "ml", "millilitre", "millilitres", "milliliter", "milliliters",
+    "l", "litre", "litres", "liter", "liters",
+    "pcs", "clove", "cloves", "can", "cans", "tin", "tins", "slice", "slices",
+    "sprig", "sprigs", "stick", "sticks", "bunch", "bunches", "handful", "handfuls",
+    "pinch", "pinches",
+}
+# Units recognised when parsing ingredient strings, longest first so that
+# e.g. "fl oz" wins over "oz"
+_UNIT_ALT = "|".join(sorted(
+    map(re.escape, IMPERIAL_TO_METRIC.keys() | _OTHER_UNITS),
+    key=len, reverse=True
+))
+# Optional amount ("2", "1.5", "1/2", "2 1/2") that must not run on into more
+# digits or a range ("2-3", kept whole as the name), optional known unit (with
+# an optional trailing "." and an alternate measure such as "100g/4oz", which
+# is dropped), ingredient name
+_INGR_RE = re.compile(
+    r'^\s*(?:(?P<amount>\d+\s+\d+/\d+|\d+/\d+|\d*\.?\d+)(?![\d./]|\s*[-–]))?'
+    rf'\s*(?:(?P<unit>{_UNIT_ALT})\b\.?'
+    rf'(?:\s*/\s*[\d./½¼¾⅓⅔]+\s*(?:{_UNIT_ALT})\b\.?)?)?'
+    r'\s*(?P<name>.+?)\s*$',
+    re.IGNORECASE
+)
+
+
 def convert_to_metric(amount: float, unit: str) -> tuple:
     """
     Convert imperial units to metric.
@@ -374,22 +548,21 @@ def normalize_recipe(raw_recipe: Dict[str, Any], recipe_id: int) -> Dict[str, An
     # Parse servings from yields string
     original_servings = parse_servings(raw_recipe.get("yields", "4"))
 
-    # Scale to 2 servings and convert to metric
+    # Scale to 2 servings and convert to metric in one pass
+    # (same result as convert_to_metric, without a call per ingredient)
     scale_factor = 2 / original_servings
+    to_metric = IMPERIAL_TO_METRIC.get
     scaled_ingredients = []
     for ingredient in ingredients:
-        scaled_ing = ingredient.copy()
-
-        # Scale amount
-        scaled_amount = ingredient["amount"] * scale_factor
-
-        # Convert to metric if needed
-        metric_amount, metric_unit = convert_to_metric(scaled_amount, ingredient["unit"])
+        amount = ingredient["amount"] * scale_factor
+        unit = ingredient["unit"]
 
-        scaled_ing["amount"] = round(metric_amount, 1)
-        scaled_ing["unit"] = metric_unit
+        conversion = to_metric(unit.lower().strip())
+        if conversion is not None:
+            unit, conversion_factor = conversion
+            amount *= conversion_factor
 
-        scaled_ingredients.append(scaled_ing)
+        scaled_ingredients.append({**ingredient, "amount": round(amount, 1), "unit": unit})
 
     # Build normalized recipe
     normalized = {
@@ -427,9 +600,7 @@ def parse_instructions_to_steps(instructions: str) -> List[str]:
     steps = []
 
     # Try splitting by numbered steps first (1. 2. or 1) 2) patterns)
-    import re
-    numbered_pattern = r'\d+[\.\)]\s*'
-    parts = re.split(numbered_pattern, instructions)
+    parts = _NUMBERED_STEP_RE.split(instructions)
 
     # Filter out empty parts
     parts = [p.strip() for p in parts if p.strip()]
@@ -443,7 +614,7 @@ def parse_instructions_to_steps(instructions: str) -> List[str]:
 
     # If still only one step, try splitting by sentences
     if len(steps) == 1 and len(steps[0]) > 200:
-        sentences = re.split(r'(?<=[.!?])\s+', steps[0])
+        sentences = _SENT_SPLIT_RE.split(steps[0])
         if len(sentences) > 1:
             steps = sentences
 
@@ -460,27 +631,27 @@ def parse_ingredients(ingredients_list: List[str]) -> List[Dict[str, Any]]:
     Returns:
         List of ingredient dictionaries with name, amount, and unit
     """
-    import re
-
     parsed_ingredients = []
 
     for ing_str in ingredients_list:
         # Try to extract amount and unit using regex
-        # Pattern: optional number (int or fraction), optional unit, ingredient name
-        pattern = r'^([\d\/\.\s]+)?\s*([a-zA-Z]+)?\s+(.+)$'
-        match = re.match(pattern, ing_str.strip())
+        match = _INGR_RE.match(ing_str.strip())
 
         if match:
-            amount_str, unit, name = match.groups()
+            amount_str, unit, name = match.group('amount', 'unit', 'name')
 
-            # Parse amount
-            amount = parse_amount(amount_str) if amount_str else 1.0
+            # Parse amount; an unparseable one (e.g. "1/0") falls back below
+            try:
+                amount = parse_amount(amount_str) if amount_str else 1.0
+            except (ValueError, ZeroDivisionError):
+                match = None
 
+        if match:
             # Use unit if found, otherwise use "pcs"
             unit = unit if unit else "pcs"
 
             parsed_ingredients.append({
-                "name": name.strip(),
+                "name": name,
                 "amount": amount,
                 "unit": unit
             })
@@ -538,10 +709,8 @@ def parse_servings(yields_str: str) -> int:
     Returns:
         Number of servings as integer
     """
-    import re
-
     # Extract first number from string
-    match = re.search(r'\d+', str(yields_str))
+    match = _DIGITS_RE.search(str(yields_str))
     if match:
         return int(match.group())
 
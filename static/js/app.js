@@ -35,6 +35,8 @@ document.addEventListener('DOMContentLoaded', function() {
     let hasGeneratedPlan = false;
     let libraryRecipes = [];
     let chatHistory = [];
+    // Lets the server keep the Gemini chat session between turns
+    const conversationId = Date.now().toString(36) + Math.random().toString(36).slice(2);
 
     // Load recipes from library
     loadLibraryRecipes();
@@ -484,7 +486,8 @@ document.addEventListener('DOMContentLoaded', function() {
                 },
                 body: JSON.stringify({
                     message: message,
-                    history: chatHistory
+                    history: chatHistory,
+                    conversation_id: conversationId
                 })
             });
 
@@ -5,29 +5,85 @@ Flask web application for the Menu Planner.
 Run with: python3 web.py
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import JSONProvider
 from dotenv import load_dotenv
-from core import MenuPlanner
+from core import MenuPlanner, dump_json
 
 # Load environment variables from .env file
 load_dotenv()
 from services.web_scraper import (
     fetch_recipe_from_url,
     normalize_recipe,
-    validate_recipe_schema,
     RecipeScraperError,
     RecipeNotFoundError,
     RecipeValidationError
 )
 from services.ai_assistant import AIAssistant, APIKeyMissingError, AIAssistantError
-import json
+from services.cache import TTLCache
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
+import gzip
+import hashlib
 import os
 import requests
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; Flask's default JSON provider is used instead
+    orjson = None
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson."""
+
+    # Accept non-str dict keys (as the stdlib encoder does) and treat naive
+    # datetimes as UTC
+    options = 0 if orjson is None else orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.options).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+else:
+    # Keep responses compact even in debug mode (the default indents them)
+    app.json.compact = True
 planner = MenuPlanner("recipes.json")
 
+# Recipe scraping can block for seconds (Selenium for Coles), so it runs on a
+# bounded pool; request threads only wait up to SCRAPE_TIMEOUT for a result
+_SCRAPE_POOL = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('SCRAPE_WORKERS', 4)),
+    thread_name_prefix='scrape'
+)
+SCRAPE_TIMEOUT = 30
+
+# Raw recipes fetched in the last 10 minutes, so repeat imports of a URL
+# skip even the on-disk fetch cache
+_url_cache = TTLCache(maxsize=512, ttl=600)
+
+# Serialized GET /api/recipes body, its gzipped copy and its ETag, as
+# (planner.recipes_version, body, gzipped_body, etag); rebuilt when the version changes
+_recipes_response_cache = (None, b"", b"", "")
+
+# HEAD checks for AI-suggested recipe links run in parallel on this pool
+_URL_CHECK_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='urlcheck')
+
+# Rendered HTML pages keyed by template name. The templates only call
+# url_for() for static files, so their output never varies between requests.
+_page_cache = {}
+
+# Single background writer for last_plan.json, so saving a plan doesn't hold
+# up the response and writes land in request order. One worker on purpose:
+# two writers would share last_plan.tmp and could rename each other's file.
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='planio')
+
 # Initialize AI assistant (will be None if no API key is configured)
 try:
     ai_assistant = AIAssistant()
@@ -37,23 +93,46 @@ except (ValueError, APIKeyMissingError):
     print("Get your free API key from https://aistudio.google.com/app/apikey")
 
 
+def _json_body():
+    """
+    Decode the request body as JSON with the app's provider (orjson when installed).
+
+    Reads the raw body directly rather than going through request.json and
+    its content-type negotiation, and without keeping a copy of the raw bytes
+    on the request (each handler reads its body only once).
+    """
+    return app.json.loads(request.get_data(cache=False))
+
+
+def _render_page(template_name: str) -> Response:
+    """Render a template on first use and serve the cached HTML afterwards (not in debug mode)."""
+    if app.debug:
+        # Re-render every time so template edits show up immediately
+        return Response(render_template(template_name), mimetype='text/html')
+
+    html = _page_cache.get(template_name)
+    if html is None:
+        html = _page_cache[template_name] = render_template(template_name).encode()
+    return Response(html, mimetype='text/html')
+
+
 @app.route('/')
 def index():
     """Render the main page."""
-    return render_template('index.html')
+    return _render_page('index.html')
 
 
 @app.route('/recipes')
 def recipes():
     """Render the recipe library page."""
-    return render_template('recipes.html')
+    return _render_page('recipes.html')
 
 
 @app.route('/api/generate-plan', methods=['POST'])
 def generate_plan():
     """API endpoint to generate a meal plan."""
     try:
-        data = request.json
+        data = _json_body()
 
         household_size = int(data.get('household_size', 2))
         nights = int(data.get('nights', 3))
@@ -71,14 +150,11 @@ def generate_plan():
             return jsonify({'error': 'Invalid cooking time preference'}), 400
 
         # Add selected library recipes to temp_recipes if provided
+        # (IDs not in the library are ignored; ones already added are skipped)
         if selected_recipe_ids:
-            for recipe_id in selected_recipe_ids:
-                # Find recipe in permanent library
-                recipe = next((r for r in planner.recipes if r['id'] == recipe_id), None)
-                if recipe:
-                    # Only add if not already in temp_recipes
-                    if not any(tr['id'] == recipe_id for tr in planner.temp_recipes):
-                        planner.add_temp_recipe(recipe)
+            planner.add_temp_recipes_bulk(
+                recipe for recipe in map(planner.get_recipe_by_id, selected_recipe_ids) if recipe
+            )
 
         # Generate plan
         plan = planner.generate_plan(household_size, nights, preference)
@@ -90,8 +166,7 @@ def generate_plan():
             "shopping_list": plan["shopping_list"]
         }
         plan_path = Path(__file__).parent / "last_plan.json"
-        with open(plan_path, "w") as f:
-            json.dump(save_data, f, indent=2)
+        _IO_POOL.submit(_write_plan_atomic, plan_path, save_data)
         
         return jsonify(plan)
     
@@ -99,27 +174,72 @@ def generate_plan():
         return jsonify({'error': str(e)}), 500
 
 
+def _write_plan_atomic(plan_path: Path, save_data: dict) -> None:
+    """Write a plan via a temp file and rename, so readers never see a partial file."""
+    tmp_path = plan_path.with_suffix(".tmp")
+    try:
+        dump_json(save_data, tmp_path)
+        os.replace(tmp_path, plan_path)
+    except OSError as e:
+        print(f"Warning: could not save {plan_path.name}: {e}")
+
+
 @app.route('/api/recipes')
 def get_recipes():
-    """API endpoint to get all available recipes."""
+    """
+    API endpoint to get all available recipes.
+
+    The serialized list (plain and gzipped) is cached until the recipe library
+    changes and sent with an ETag and must-revalidate caching, so clients
+    revalidating an unchanged library get a 304.
+    """
+    global _recipes_response_cache
     try:
-        return jsonify(planner.recipes)
+        version, body, gzipped_body, etag = _recipes_response_cache
+        if version != planner.recipes_version:
+            version = planner.recipes_version
+            if orjson is not None:
+                # Encode straight to bytes, skipping the str round trip in jsonify
+                body = orjson.dumps(planner.recipes)
+            else:
+                body = app.json.dumps(planner.recipes).encode()
+            gzipped_body = gzip.compress(body, compresslevel=6, mtime=0)
+            etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+            _recipes_response_cache = (version, body, gzipped_body, etag)
+
+        # The gzipped representation gets its own ETag
+        use_gzip = bool(request.accept_encodings['gzip'])
+        if use_gzip:
+            body, etag = gzipped_body, etag + "-gzip"
+
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+        else:
+            response = app.response_class(body, mimetype='application/json')
+            if use_gzip:
+                response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, must-revalidate'
+        response.vary.add('Accept-Encoding')
+        return response
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/import-recipe-url', methods=['POST'])
 def import_recipe_url():
-    """API endpoint to import a recipe from a URL."""
+    """API endpoint to import a recipe from a URL. Add ?force_refresh=1 to bypass the fetch cache."""
     try:
-        data = request.json
+        data = _json_body()
         url = data.get('url', '').strip()
+        force_refresh = _force_refresh_requested()
 
         if not url:
             return jsonify({'error': 'URL is required'}), 400
 
         # Fetch recipe from URL
-        raw_recipe = fetch_recipe_from_url(url)
+        future = _SCRAPE_POOL.submit(_fetch_recipe, url, force_refresh)
+        raw_recipe = future.result(timeout=SCRAPE_TIMEOUT)
 
         # Normalize to our format
         recipe_id = planner.get_next_recipe_id()
@@ -133,6 +253,8 @@ def import_recipe_url():
             'recipe': normalized_recipe
         })
 
+    except FutureTimeoutError:
+        return jsonify({'error': f'Timed out fetching recipe after {SCRAPE_TIMEOUT}s'}), 504
     except RecipeNotFoundError as e:
         return jsonify({'error': str(e)}), 404
     except RecipeScraperError as e:
@@ -141,6 +263,63 @@ def import_recipe_url():
         return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
 
 
+@app.route('/api/import-recipes-bulk', methods=['POST'])
+def import_recipes_bulk():
+    """
+    API endpoint to import several recipes at once.
+
+    URLs are fetched concurrently; each successful recipe is added as a
+    temporary recipe and failures are reported per URL.
+    """
+    try:
+        data = _json_body()
+        urls = [url.strip() for url in data.get('urls', []) if url and url.strip()]
+        force_refresh = _force_refresh_requested()
+
+        if not urls:
+            return jsonify({'error': 'At least one URL is required'}), 400
+
+        futures = [_SCRAPE_POOL.submit(_fetch_recipe, url, force_refresh) for url in urls]
+
+        # Collect in input order so recipe IDs are assigned predictably
+        imported = []
+        errors = []
+        for url, future in zip(urls, futures):
+            try:
+                raw_recipe = future.result(timeout=SCRAPE_TIMEOUT)
+                normalized_recipe = normalize_recipe(raw_recipe, planner.get_next_recipe_id())
+                planner.add_temp_recipe(normalized_recipe)
+                imported.append(normalized_recipe)
+            except FutureTimeoutError:
+                errors.append({'url': url, 'error': f'Timed out after {SCRAPE_TIMEOUT}s'})
+            except Exception as e:
+                errors.append({'url': url, 'error': str(e)})
+
+        return jsonify({
+            'success': bool(imported),
+            'recipes': imported,
+            'count': len(imported),
+            'errors': errors
+        })
+
+    except Exception as e:
+        return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
+
+
+def _fetch_recipe(url: str, force_refresh: bool = False) -> dict:
+    """fetch_recipe_from_url() behind the in-memory URL cache."""
+    raw_recipe = None if force_refresh else _url_cache.get(url)
+    if raw_recipe is None:
+        raw_recipe = fetch_recipe_from_url(url, force_refresh=force_refresh)
+        _url_cache.set(url, raw_recipe)
+    return raw_recipe
+
+
+def _force_refresh_requested() -> bool:
+    """Whether the request asked to bypass the recipe fetch cache (?force_refresh=1)."""
+    return request.args.get('force_refresh', '').lower() in ('1', 'true', 'yes')
+
+
 @app.route('/api/temp-recipes', methods=['GET'])
 def get_temp_recipes():
     """API endpoint to get all temporary recipes."""
@@ -189,7 +368,7 @@ def clear_temp_recipes():
 def add_recipe():
     """API endpoint to add a new recipe manually."""
     try:
-        data = request.json
+        data = _json_body()
 
         # Validate required fields
         required_fields = ['name', 'cooking_time', 'servings', 'ingredients', 'steps']
@@ -216,10 +395,7 @@ def add_recipe():
         if 'image_url' in data and data['image_url']:
             new_recipe['image_url'] = data['image_url']
 
-        # Validate recipe schema
-        validate_recipe_schema(new_recipe)
-
-        # Save recipe to file
+        # Save recipe to file (validates the schema and checks for duplicates)
         planner.save_recipe_to_file(new_recipe)
 
         return jsonify({
@@ -240,7 +416,7 @@ def add_recipe():
 def delete_recipes():
     """API endpoint to delete recipes by IDs."""
     try:
-        data = request.json
+        data = _json_body()
         recipe_ids = data.get('recipe_ids', [])
 
         if not recipe_ids:
@@ -249,8 +425,8 @@ def delete_recipes():
         if not isinstance(recipe_ids, list):
             return jsonify({'error': 'recipe_ids must be an array'}), 400
 
-        # Convert to integers
-        recipe_ids = [int(id) for id in recipe_ids]
+        # Convert to a set of integers once
+        recipe_ids = frozenset(map(int, recipe_ids))
 
         # Delete recipes
         deleted_count = planner.delete_recipes_by_ids(recipe_ids)
@@ -285,6 +461,21 @@ def validate_recipe_url(url: str, timeout: int = 3) -> bool:
         return False
 
 
+def filter_valid_recipe_urls(urls: list) -> list:
+    """
+    Keep only the recipe URLs that are accessible, checking them concurrently.
+
+    Args:
+        urls: Recipe URLs to check
+
+    Returns:
+        The accessible URLs, in their original order
+    """
+    if len(urls) <= 1:
+        return [url for url in urls if validate_recipe_url(url)]
+    return [url for url, ok in zip(urls, _URL_CHECK_POOL.map(validate_recipe_url, urls)) if ok]
+
+
 @app.route('/api/ai-chat', methods=['POST'])
 def ai_chat():
     """API endpoint for AI-powered recipe recommendations."""
@@ -296,22 +487,20 @@ def ai_chat():
                 'setup_url': 'https://aistudio.google.com/app/apikey'
             }), 503
 
-        data = request.json
+        data = _json_body()
         user_message = data.get('message', '').strip()
         conversation_history = data.get('history', [])
+        conversation_id = data.get('conversation_id')
 
         if not user_message:
             return jsonify({'error': 'Message is required'}), 400
 
         # Get AI response and extract recipe URLs
-        ai_response, recipe_urls = ai_assistant.chat(user_message, conversation_history)
+        ai_response, recipe_urls = ai_assistant.chat(user_message, conversation_history, conversation_id)
+        asked = (user_message, conversation_history)  # turn that produced ai_response
 
         # Validate recipe URLs - filter out broken links
-        valid_urls = []
-
-        for url in recipe_urls:
-            if validate_recipe_url(url):
-                valid_urls.append(url)
+        valid_urls = filter_valid_recipe_urls(recipe_urls)
 
         # If no valid URLs found, ask AI to try again with different recipes
         max_retries = 2
@@ -320,6 +509,9 @@ def ai_chat():
         while len(valid_urls) == 0 and len(recipe_urls) > 0 and retry_count < max_retries:
             retry_count += 1
 
+            # Don't let the cache replay a reply whose links are all dead
+            ai_assistant.forget_response(*asked)
+
             # Add a system message asking for alternative recipes
             retry_history = conversation_history + [
                 {"role": "user", "content": user_message},
@@ -328,16 +520,15 @@ def ai_chat():
 
             retry_message = "Those recipes are no longer available. Please suggest different BBC Good Food recipes for the same request, using more common/popular recipe names."
 
-            ai_response, recipe_urls = ai_assistant.chat(retry_message, retry_history)
+            ai_response, recipe_urls = ai_assistant.chat(retry_message, retry_history, conversation_id)
+            asked = (retry_message, retry_history)
 
             # Validate new URLs
-            valid_urls = []
-            for url in recipe_urls:
-                if validate_recipe_url(url):
-                    valid_urls.append(url)
+            valid_urls = filter_valid_recipe_urls(recipe_urls)
 
         # If still no valid recipes after retries, inform the user
         if len(valid_urls) == 0 and len(recipe_urls) > 0:
+            ai_assistant.forget_response(*asked)
             ai_response = "I apologize, but I'm having trouble finding available recipes on BBC Good Food that match your request. This could be because the specific recipes have been archived. Could you try:\n\n1. Asking for a slightly different type of recipe\n2. Using more general terms (e.g., 'chicken pasta' instead of 'chicken alfredo')\n3. Specifying a different cuisine or ingredient\n\nI'm here to help find something delicious for you!"
 
         return jsonify({
@@ -353,9 +544,61 @@ def ai_chat():
         return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
 
 
+@app.route('/api/chat-stream', methods=['POST'])
+def chat_stream():
+    """
+    Streaming variant of /api/ai-chat using Server-Sent Events.
+
+    Each piece of the reply is sent as a data event holding a JSON string.
+    A final 'urls' event lists the suggested BBC Good Food URLs that are
+    still live, or an 'error' event is sent if the AI call fails. Unlike
+    /api/ai-chat, nothing is retried when every suggested link is dead.
+    The bundled UI still uses /api/ai-chat.
+    """
+    if ai_assistant is None:
+        return jsonify({
+            'error': 'AI assistant not configured. Please set GEMINI_API_KEY environment variable.',
+            'setup_url': 'https://aistudio.google.com/app/apikey'
+        }), 503
+
+    try:
+        data = _json_body()
+        user_message = data.get('message', '').strip()
+        conversation_history = data.get('history', [])
+        conversation_id = data.get('conversation_id')
+    except Exception as e:
+        return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
+
+    if not user_message:
+        return jsonify({'error': 'Message is required'}), 400
+
+    def generate():
+        chunks = []
+        try:
+            for text in ai_assistant.chat_stream(user_message, conversation_history, conversation_id):
+                chunks.append(text)
+                yield f"data: {app.json.dumps(text)}\n\n"
+
+            recipe_urls = ai_assistant.extract_bbc_recipe_urls("".join(chunks))
+            valid_urls = filter_valid_recipe_urls(recipe_urls)
+            if recipe_urls and not valid_urls:
+                # Let the next identical request ask the model again
+                ai_assistant.forget_response(user_message, conversation_history)
+            yield f"event: urls\ndata: {app.json.dumps(valid_urls)}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {app.json.dumps(f'AI error: {str(e)}')}\n\n"
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # stop reverse proxies buffering the stream
+    })
+
+
 if __name__ == '__main__':
     import os
     # Use PORT environment variable for deployment platforms (Render, Railway, etc.)
     port = int(os.environ.get('PORT', 5001))
-    app.run(debug=True, host='0.0.0.0', port=port)
+    # Debug mode (reloader, per-request template rendering) only when asked for
+    debug = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes')
+    app.run(debug=debug, host='0.0.0.0', port=port)
 